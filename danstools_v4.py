@@ -11,6 +11,7 @@ bl_info = {
 }
 
 import bpy
+import numpy as np
 
 
 def apply_modifiers(obj):
@@ -34,7 +35,9 @@ class DecimationTools():
 
     def select_objects_by_poly_count(self, context):
         start_count = context.scene.start_count
-        bpy.ops.object.select_all(action='DESELECT')  # deselect all objects
+        # deselect all objects
+        for obj in context.selected_objects:
+            obj.select_set(False)
         for obj in bpy.data.objects:
             if len(obj.data.polygons) > start_count:
                 obj.select_set(True)
@@ -90,7 +93,9 @@ class MESH_OT_SelectByPolycount(bpy.types.Operator):
 
     def execute(self, context):
         start_count = context.scene.start_count
-        bpy.ops.object.select_all(action='DESELECT')  # deselect all objects
+        # deselect all objects
+        for obj in context.selected_objects:
+            obj.select_set(False)
         for obj in bpy.data.objects:
             if len(obj.data.polygons) > start_count:
                 obj.select_set(True)
@@ -340,16 +345,16 @@ class MESH_OT_pivot(bpy.types.Operator):
         bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
         bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY')
         o = bpy.context.active_object
-        init = 0
-        for x in o.data.vertices:
-            if init == 0:
-                a = x.co.z
-                init = 1
-            elif x.co.z < a:
-                a = x.co.z
-
-        for x in o.data.vertices:
-            x.co.z -= a
+
+        # Pull every vertex position in one call and take the lowest z
+        coords = np.empty(len(o.data.vertices) * 3, dtype=np.float32)
+        o.data.vertices.foreach_get('co', coords)
+        a = float(coords[2::3].min())
+
+        # Shift them down and write them all back in one call
+        coords[2::3] -= a
+        o.data.vertices.foreach_set('co', coords)
+        o.data.update()
 
         o.location.z += a
 
@@ -11,6 +11,7 @@ from random import randint, choice, shuffle
 import os
 from tkinter import filedialog as fd
 FONT = 'e:/scripts/Minecraftia-Regular.ttf'
+DEBUG = False  # print per-image debug info
 filenames = ""
 
 
@@ -36,12 +37,13 @@ def resize():
 
     for filename in filenames:
         im = Image.open(filename)
-        print(filename)
         im_resized = im.resize((512, 512))
         file_name = os.path.basename(filename[:-4])
         file_path = os.path.dirname(filename)
-        print(file_name)
-        print(file_path)
+        if DEBUG:
+            print(filename)
+            print(file_name)
+            print(file_path)
         im_resized.save(os.path.join(file_path, f"{file_name}_512.png"))
 
 
@@ -122,10 +124,11 @@ def textify():
             text_position_width = 0
             text_position_height = height / 2
 
-        print(width)
-        print(width/2)
-        print(text_anchor)
-        print(list(text.split(",")))
+        if DEBUG:
+            print(width)
+            print(width/2)
+            print(text_anchor)
+            print(list(text.split(",")))
         file_name = os.path.basename(filename)
         file_path = os.path.dirname(filename)
 
@@ -1,5 +1,5 @@
 import bpy
-import bmesh
+import numpy as np
 from mathutils import Vector, Matrix
 
 class StabilizeOperator(bpy.types.Operator):
@@ -24,12 +24,10 @@ class StabilizeOperator(bpy.types.Operator):
         mesh = obj.data
 
         # Access selected vertices
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        selected_verts = [v for v in bm.verts if v.select]
-        if not selected_verts:
+        selection = np.empty(len(mesh.vertices), dtype=bool)
+        mesh.vertices.foreach_get('select', selection)
+        if not selection.any():
             self.report({'ERROR'}, "No vertices selected")
-            bm.free()
             return {'CANCELLED'}
 
         # Frame range
@@ -39,26 +37,37 @@ class StabilizeOperator(bpy.types.Operator):
 
         # Perform operation
         if self.operation == 'TRANSLATION':
-            self.stabilize_translation(context, obj, selected_verts, frame_start, frame_end)
+            selected_co = self.selected_rows(mesh.vertices, 'co', selection)
+            self.stabilize_translation(context, obj, selected_co, frame_start, frame_end)
         elif self.operation == 'ROTATION':
-            self.stabilize_rotation(context, obj, selected_verts, frame_start, frame_end)
+            selected_normals = self.selected_rows(mesh.vertices, 'normal', selection)
+            self.stabilize_rotation(context, obj, selected_normals, frame_start, frame_end)
 
         # Cleanup
-        bm.free()
         context.scene.frame_set(original_frame)
         return {'FINISHED'}
 
-    def stabilize_translation(self, context, obj, selected_verts, frame_start, frame_end):
+    @staticmethod
+    def selected_rows(vertices, attribute, selection):
+        # Read a vector attribute for all vertices in one call, keep the selected ones
+        values = np.empty(len(vertices) * 3, dtype=np.float32)
+        vertices.foreach_get(attribute, values)
+        return values.reshape(-1, 3)[selection]
+
+    def stabilize_translation(self, context, obj, selected_co, frame_start, frame_end):
         for frame in range(frame_start, frame_end + 1):
             context.scene.frame_set(frame)
-            avg_position = sum((obj.matrix_world @ v.co for v in selected_verts), Vector()) / len(selected_verts)
+            matrix = np.array(obj.matrix_world, dtype=np.float32)
+            world_co = selected_co @ matrix[:3, :3].T + matrix[:3, 3]
+            avg_position = Vector(world_co.mean(axis=0).tolist())
             obj.location -= avg_position
             obj.keyframe_insert(data_path="location", frame=frame)
 
-    def stabilize_rotation(self, context, obj, selected_verts, frame_start, frame_end):
+    def stabilize_rotation(self, context, obj, selected_normals, frame_start, frame_end):
         for frame in range(frame_start, frame_end + 1):
             context.scene.frame_set(frame)
-            avg_normal = sum((obj.matrix_world.to_3x3() @ v.normal for v in selected_verts), Vector()) / len(selected_verts)
+            rotation_3x3 = np.array(obj.matrix_world.to_3x3(), dtype=np.float32)
+            avg_normal = Vector((selected_normals @ rotation_3x3.T).mean(axis=0).tolist())
             avg_normal.normalize()
             rotation = avg_normal.to_track_quat('Z', 'Y').to_matrix().to_4x4()
             obj.matrix_world = rotation @ obj.matrix_world